@@ -3,42 +3,57 @@ from decimal import Decimal
 # Using floats for calculations with currencies doesn't really make sense, as they aren't exact
 # as we learned in PROG1 with the 0.1 + 0.2 example.
 # After googling it turns out there's a builtin module called Decimal which is perfectly suitable for this excercise
+# Internally the amounts are kept as integer cents though, Decimal is only used to parse and display them.
+
+
+def _to_cents(amount: str | Decimal) -> int:
+    """Converts an amount into integer cents, this is done once at the API boundary.
+    Amounts with fractions of a cent are rejected instead of being rounded away"""
+    cents = Decimal(amount) * 100
+    if not cents.is_finite() or cents != cents.to_integral_value():
+        raise ValueError("Amount needs to be a finite number with at most two decimal places")
+    return int(cents)
 
 
 class BankAccount:
+    __slots__ = ("iban", "_currency", "open", "_balance", "min_balance", "max_balance")
+
     def __init__(self, iban: str, currency: str = "CHF"):
         self.iban = iban
         self._currency = currency
         self.open = True
-        self.balance = Decimal("0")
-        self.min_balance = Decimal("0")
-        self.max_balance = Decimal("100000")
+        self._balance = 0
+        self.min_balance = 0
+        self.max_balance = 10_000_000
 
     @property
     def currency(self) -> str:
         """This is to make a "private" attribute, although there is no such thing in python as self._currency can still be changed"""
         return self._currency
 
-    def deposit(self, amount: str | Decimal) -> Decimal:
+    @property
+    def balance(self) -> Decimal:
+        """Balance converted back from cents, so formatting like f"{account.balance:.2f}" keeps working"""
+        return Decimal(self._balance).scaleb(-2)
+
+    def deposit(self, amount: str | Decimal) -> None:
         """Deposit an amount into the acount with all the necessary validators. Note: We may want to abstract these validators in the future."""
         if self.open:
-            if type(amount) is str:
-                amount = Decimal(amount)
-            if self.balance + amount <= self.max_balance:
-                self.balance += amount
+            amount = _to_cents(amount)
+            if self._balance + amount <= self.max_balance:
+                self._balance += amount
             else:
                 raise ValueError("Cannot deposit, maximum balance amount would be reached")
         else:
             raise ValueError("Deposit not possible on closed account")
 
-    def withdraw(self, amount: str | Decimal) -> Decimal:
+    def withdraw(self, amount: str | Decimal) -> None:
         """Withdraw an amount from the acount with all the necessary validators. Note: We may want to abstract these validators in the future."""
         if self.open:
-            if type(amount) is str:
-                amount = Decimal(amount)
+            amount = _to_cents(amount)
 
-            if self.balance - amount >= self.min_balance:
-                self.balance -= amount
+            if self._balance - amount >= self.min_balance:
+                self._balance -= amount
             else:
                 raise ValueError("Cannot withdraw, minimum balance amount would be reached")
         else:
@@ -5,6 +5,8 @@ class Document:
     :type title: str
     """
 
+    __slots__ = ("title", "owner")
+
     def __init__(self, title: str):
         self.title = title
         self.owner: "ClassPerson" = None
@@ -20,9 +22,12 @@ class Table:
     :type number: int
     """
 
+    __slots__ = ("number", "occupants")
+
     def __init__(self, number: int):
         self.number = number
-        self.occupants: list["Student"] = []
+        # dicts are used as insertion ordered sets, so removing an occupant is O(1)
+        self.occupants: dict["Student", None] = {}
 
     def __str__(self):
         return f"Table(number={self.number}, occupants={[occupant.name for occupant in self.occupants]})"
@@ -35,6 +40,8 @@ class Blackboard:
     :type content: str
     """
 
+    __slots__ = ("content",)
+
     def __init__(self, content: str):
         self.content = content
 
@@ -49,9 +56,12 @@ class ClassPerson:
     :type name: str
     """
 
+    __slots__ = ("name", "documents")
+
     def __init__(self, name: str):
         self.name = name
-        self.documents: list[Document] = []
+        # dicts are used as insertion ordered sets, so removing a document is O(1)
+        self.documents: dict[Document, None] = {}
 
     def assign_document(self, document: Document):
         """Assigns a document to the person.
@@ -63,10 +73,10 @@ class ClassPerson:
         """
 
         if document.owner:
-            document.owner.documents.remove(document)
+            del document.owner.documents[document]
 
         document.owner = self
-        self.documents.append(document)
+        self.documents[document] = None
 
     def __str__(self):
         return f"ClassPerson(name='{self.name}', documents={[doc.title for doc in self.documents]})"
@@ -79,6 +89,8 @@ class Student(ClassPerson):
     :type name: str
     """
 
+    __slots__ = ("table",)
+
     def __init__(self, name: str):
         self.table: Table = None
         super().__init__(name)
@@ -93,10 +105,10 @@ class Student(ClassPerson):
         """
 
         if self.table:
-            self.table.occupants.remove(self)
+            del self.table.occupants[self]
 
         self.table = table
-        table.occupants.append(self)
+        table.occupants[self] = None
 
     def __str__(self):
         return f"Student(name='{self.name}', documents={[doc.title for doc in self.documents]})"
@@ -109,6 +121,8 @@ class Teacher(ClassPerson):
     :type name: str
     """
 
+    __slots__ = ()
+
     def __init__(self, name: str):
         super().__init__(name)
 
@@ -128,20 +142,17 @@ if __name__ == "__main__":
         teacher.assign_document(Document(f"Document {i}"))
 
     # create tables
-    tables = [Table(i + 1) for i in range(10)]
+    tables: list[Table] = [Table(i + 1) for i in range(10)]
 
     # create students
-    students = [Student(f"Student {i}") for i in range(20)]
+    students: list[Student] = [Student(f"Student {i}") for i in range(20)]
 
-    # students are seated at tables
-    for student in students:
-        for table in tables:
-            if len(table.occupants) < 2:
-                student.sit(table)
-                break
+    # students are seated at tables, two per table
+    for i, student in enumerate(students):
+        student.sit(tables[i // 2])
 
     # documents are handed out to students
-    for i, document in enumerate(teacher.documents[:]):
+    for i, document in enumerate(list(teacher.documents)):
         students[i].assign_document(document)
 
     # Classroom showcase
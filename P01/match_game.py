@@ -1,4 +1,5 @@
 import random
+import sys
 from enum import Enum, auto
 
 
@@ -7,12 +8,17 @@ class Strategy(Enum):
     SMART = auto()
 
 
+# matches the computer draws with the smart strategy, indexed by stack % 4
+_SMART_DRAW = (3, 1, 1, 2)
+
+
 class MatchGame:
     def __init__(self, strategy=Strategy.RANDOM):
         """gets the gaming strategy of the computer and derives who starts the game"""
-        self.stack = random.randint(10, 20)
-        self.user_first = bool(random.randint(0, 1))
+        self.stack = random.randrange(10, 21)
+        self.user_first = bool(random.getrandbits(1))
         self.strategy = strategy
+        self._line = "========O\n"
 
         if self.user_first:
             self.turn = "user"
@@ -24,8 +30,8 @@ class MatchGame:
 
     def display_progress(self):
         '''displays the "game board"'''
-        print(f"\nMatches left: {self.stack}")
-        print("========O\n" * self.stack)
+        sys.stdout.write(f"\nMatches left: {self.stack}\n{self._line * self.stack}\n")
+        sys.stdout.flush()
 
     def user_draw(self):
         """user selection of draws"""
@@ -45,16 +51,10 @@ class MatchGame:
         """computer selection of draws based on given strategy"""
         if self.strategy == Strategy.RANDOM:
             # Random strategy - just pick 1-3 randomly
-            com_input = min(random.randint(1, 3), self.stack)
+            com_input = min(random.randrange(1, 4), self.stack)
         elif self.strategy == Strategy.SMART:
-            # Smart strategy based on modular arithmetic
-            remainder = self.stack % 4
-            if remainder == 0:
-                com_input = min(3, self.stack)
-            elif remainder == 3:
-                com_input = min(2, self.stack)
-            else:  # remainder is 1 or 2
-                com_input = min(1, self.stack)
+            # Smart strategy based on modular arithmetic, looked up instead of branching
+            com_input = min(_SMART_DRAW[self.stack % 4], self.stack)
 
         self.draw(com_input)
         print(f"Computer drew {com_input} matches.")
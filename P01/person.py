@@ -1,11 +1,12 @@
+import functools
 import importlib.util
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from enum import Enum, auto
 
 # Defines a basic person class with some basic properties, calculated properties and methods
 # Also added an optional speak method which uses a really small llm to reply to the users prompt
 # It only works if the transformers package is installed and also note that it will download a ~140mb model file if you want to try it out.
-# LLM inference runs always on cpu
+# LLM inference runs always on cpu, with the linear layers dynamically quantized to int8
 
 
 class Color(Enum):
@@ -16,6 +17,20 @@ class Color(Enum):
     GREY = auto()
 
 
+@functools.cache
+def _get_llm():
+    """Loads the tokenizer and model once, every further call reuses them.
+    The linear layers are quantized to int8 as inference runs on the cpu anyway"""
+    import torch
+    from transformers import AutoModelForCausalLM, AutoTokenizer
+
+    tokenizer = AutoTokenizer.from_pretrained("HuggingFaceTB/SmolLM-135M-Instruct")
+    model = AutoModelForCausalLM.from_pretrained("HuggingFaceTB/SmolLM-135M-Instruct").to("cpu")
+    model.eval()
+    model = torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    return tokenizer, model
+
+
 class Person:
     def __init__(self, given_name: str, last_name: str, haircolor: Color, birthday: datetime, shoe_size: int):
         self.given_name = given_name
@@ -36,10 +51,9 @@ class Person:
             print(text)
 
         else:
-            from transformers import AutoModelForCausalLM, AutoTokenizer
+            import torch
 
-            tokenizer = AutoTokenizer.from_pretrained("HuggingFaceTB/SmolLM-135M-Instruct")
-            model = AutoModelForCausalLM.from_pretrained("HuggingFaceTB/SmolLM-135M-Instruct").to("cpu")
+            tokenizer, model = _get_llm()
 
             messages = [
                 {
@@ -50,7 +64,8 @@ class Person:
             ]
             input_text = tokenizer.apply_chat_template(messages, tokenize=False)
             inputs = tokenizer.encode(input_text, return_tensors="pt").to("cpu")
-            outputs = model.generate(inputs, max_new_tokens=50, temperature=0.2, top_p=0.9, do_sample=True)
+            with torch.inference_mode():
+                outputs = model.generate(inputs, max_new_tokens=50, temperature=0.2, top_p=0.9, do_sample=True)
             print(tokenizer.decode(outputs[0]).split("<|im_start|>assistant")[1].strip("<|im_end|>"))
 
     @property
@@ -66,9 +81,29 @@ class Person:
         """
         return int(self.age.days / 365)
 
+    @property
+    def days_until_birthday(self) -> int:
+        """
+        Returns the days until the next birthday, 0 if it's today.
+        People born on the 29th of February get their birthday on the 1st of March in non leap years.
+        """
+        today = date.today()
+
+        def birthday_in(year: int) -> date:
+            try:
+                return self.birthday.date().replace(year=year)
+            except ValueError:
+                return date(year, 3, 1)
+
+        next_birthday = birthday_in(today.year)
+        if next_birthday < today:
+            next_birthday = birthday_in(today.year + 1)
+        return (next_birthday - today).days
+
 
 if __name__ == "__main__":
     myself = Person("Christian", "Bosshard", Color.BLACK, datetime(2001, 6, 28, 16, 00), 42)
     myself.speak("What's your name?")
     print(myself.age)
     print(myself.age_in_years)
+    print(myself.days_until_birthday)
@@ -1,10 +1,15 @@
+import hashlib
+import hmac
+import operator
+import os
 import random
 import string
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
-from typing import Dict, List, Union
+from decimal import Decimal, InvalidOperation
+from typing import Callable, Dict, List, Union
 
 import bcrypt
-from rich import print
 from rich.console import Console
 from rich.prompt import Prompt
 from rich.table import Table as RichTable
@@ -13,6 +18,13 @@ from .saving_account import SavingAccount
 from .youth_account import YouthAccount
 from .tax_report import TaxReport
 
+_BASE_OPTIONS = ("Deposit", "Withdraw", "Check Balance")
+_INTEREST_OPTIONS = ("Change Interest Rate", "Apply Monthly Interest")
+# indexed by account.opened
+_STATUS_LABELS = ("Closed", "Open")
+_IBAN_PREFIX = "CH"
+_UPPER = string.ascii_uppercase
+
 
 class ClientAccounts:
     """
@@ -21,6 +33,9 @@ class ClientAccounts:
     This class provides functionality to create, manage, and interact with
     different types of bank accounts (SavingAccount and YouthAccount).
 
+    :param bcrypt_cost: Cost factor of the password hash, defaults to the BANK_BCRYPT_COST
+        environment variable or 10
+    :type bcrypt_cost: int, optional
     :ivar accounts: Dictionary storing all client accounts
     :type accounts: Dict[str, Union[SavingAccount, YouthAccount]]
     :ivar current_account: Reference to the currently selected account
@@ -31,16 +46,39 @@ class ClientAccounts:
     :type account_owners: Dict[str, List[str]]
     """
 
-    def __init__(self) -> None:
+    def __init__(self, bcrypt_cost: int | None = None) -> None:
         self.accounts: Dict[str, Union[SavingAccount, YouthAccount]] = {}
         self.current_account: Union[SavingAccount, YouthAccount, None] = None
         self.console: Console = Console()
         self.account_owners: Dict[str, List[str]] = {}
+        self._account_names: List[str] = []
+        self._row_cache: Dict[str, tuple[str, str, str, str]] = {}
+        self._options_cache: Dict[tuple[type, bool], List[str]] = {}
+        # the keys match the menu options exactly, every option maps to the method handling it
+        self._account_actions: Dict[str, Callable[[str], None]] = {
+            "Deposit": self.__deposit,
+            "Withdraw": self.__withdraw,
+            "Check Balance": self.__check_balance,
+            "Change Interest Rate": self.__change_interest_rate,
+            "Apply Monthly Interest": self.__apply_monthly_interest,
+            "Close Account": self.__close_account,
+            "Reopen Account": self.__reopen_account,
+            "Add Owner": self.__add_account_owner,
+        }
+        self._menu_actions: Dict[str, Callable[[], None]] = {
+            "Manage account": self.__manage_account,
+            "Add account": self.__add_account,
+            "List accounts": self.display_accounts,
+            "Tax report": self.__tax_report,
+        }
+        self._menu_options: List[str] = [*self._menu_actions, "Exit"]
+
+        if bcrypt_cost is None:
+            bcrypt_cost = int(os.environ.get("BANK_BCRYPT_COST", "10"))
 
         password: str = Prompt.ask("Set password", password=True)
-        self.password_hash: bytes = bcrypt.hashpw(
-            bytes(password, encoding="utf-8"), b"$2b$12$lshujjHFpMf4uNenohn2tOjbvMkZeWzNniwEfeI0yjdCGqw29zvc."
-        )
+        self.password_hash: bytes = bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=bcrypt_cost))
+        self._verified_token: bytes | None = None
 
     def __check_password(self, password: str) -> bool:
         """
@@ -52,7 +90,34 @@ class ClientAccounts:
         :rtype: bool
         """
 
-        return bcrypt.checkpw(bytes(password, encoding="utf-8"), self.password_hash)
+        # bcrypt is slow on purpose, so a successful check is remembered as a keyed BLAKE2b token
+        password_bytes = password.encode()
+        token = hashlib.blake2b(password_bytes, key=self.password_hash).digest()
+        if self._verified_token is not None and hmac.compare_digest(token, self._verified_token):
+            return True
+
+        if bcrypt.checkpw(password_bytes, self.password_hash):
+            self._verified_token = token
+            return True
+        return False
+
+    @staticmethod
+    def verify_batch(attempts: List[tuple[str, bytes]]) -> List[bool]:
+        """
+        Verify several passwords against their hashes at once.
+
+        bcrypt releases the GIL while hashing, so the checks run in parallel on a thread pool.
+
+        :param attempts: Pairs of password and bcrypt hash to verify
+        :type attempts: List[tuple[str, bytes]]
+        :return: For every attempt, True if the password matches its hash, False otherwise
+        :rtype: List[bool]
+        """
+
+        passwords = [password.encode() for password, _ in attempts]
+        password_hashes = [password_hash for _, password_hash in attempts]
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            return list(executor.map(bcrypt.checkpw, passwords, password_hashes))
 
     def display_accounts(self) -> None:
         """
@@ -63,7 +128,7 @@ class ClientAccounts:
         """
 
         if not self.accounts:
-            print("[yellow]No accounts available.[/yellow]")
+            self.console.print("[yellow]No accounts available.[/yellow]")
             return
 
         table = RichTable(title="Account Overview", title_justify="left")
@@ -74,12 +139,19 @@ class ClientAccounts:
         table.add_column("Status")
         table.add_column("Owners")
 
+        add_row = table.add_row
+        get_fields = operator.attrgetter("balance", "currency", "opened")
+
+        # only balance and status change between renders, the other columns are cached per account
         for name, account in self.accounts.items():
-            account_type = "Saving Account" if isinstance(account, SavingAccount) else "Youth Account"
-            status = "Open" if account.opened else "Closed"
-            owners = ", ".join(self.account_owners.get(name, ["Primary Owner"]))
+            row = self._row_cache.get(name)
+            if row is None:
+                owners = ", ".join(self.account_owners.get(name, ["Primary Owner"]))
+                row = (name, account.type_name, account.iban, owners)
+                self._row_cache[name] = row
 
-            table.add_row(name, account_type, account.iban, f"{account.balance:.2f} {account.currency}", status, owners)
+            balance, currency, opened = get_fields(account)
+            add_row(*row[:3], f"{balance:.2f} {currency}", _STATUS_LABELS[opened], row[3])
 
         self.console.print(table)
 
@@ -94,81 +166,144 @@ class ClientAccounts:
         """
 
         if not self.accounts:
-            print("[red]No accounts available to manage.[/red]")
+            self.console.print("[red]No accounts available to manage.[/red]")
             return
 
         self.display_accounts()
-        account_name = Prompt.ask("Choose an account", choices=list(self.accounts.keys()))
+        account_name = Prompt.ask("Choose an account", choices=self._account_names)
         self.current_account = self.accounts[account_name]
 
         while True:
-            print(f"\n[bold]Managing: {account_name}[/bold]")
-            print(f"Balance: {self.current_account.balance:.2f} {self.current_account.currency}")
+            self.console.print(f"\n[bold]Managing: {account_name}[/bold]")
+            self.console.print(f"Balance: {self.current_account.balance:.2f} {self.current_account.currency}")
+
+            options = self.__account_options(self.current_account)
+            action = Prompt.ask("What would you like to do", choices=options)
 
-            options = ["Deposit", "Withdraw", "Check Balance", "Change Interest Rate", "Apply Monthly Interest"]
+            if action == "Back to Main Menu":
+                self.current_account = None
+                break
+            self._account_actions[action](account_name)
 
-            if self.current_account.opened:
-                options.append("Close Account")
-            else:
-                options.append("Reopen Account")
+    def __deposit(self, account_name: str) -> None:
+        """
+        Deposit an amount into the current account.
 
-            options.append("Add Owner")
-            options.append("Back to Main Menu")
+        :param account_name: The name of the current account
+        :type account_name: str
+        """
 
-            action = Prompt.ask("What would you like to do", choices=options)
+        try:
+            amount = Decimal(Prompt.ask("Enter amount to deposit"))
+            self.current_account.deposit(amount)
+            self.console.print(f"[green]Successfully deposited {amount} {self.current_account.currency}[/green]")
+        except InvalidOperation:
+            self.console.print("[red]Error: Please enter a valid amount[/red]")
+        except ValueError as e:
+            self.console.print(f"[red]Error: {e}[/red]")
+
+    def __withdraw(self, account_name: str) -> None:
+        """
+        Withdraw an amount from the current account.
+
+        :param account_name: The name of the current account
+        :type account_name: str
+        """
+
+        try:
+            amount = Decimal(Prompt.ask("Enter amount to withdraw"))
+            self.current_account.withdraw(amount)
+            self.console.print(f"[green]Successfully withdrew {amount} {self.current_account.currency}[/green]")
+        except InvalidOperation:
+            self.console.print("[red]Error: Please enter a valid amount[/red]")
+        except ValueError as e:
+            self.console.print(f"[red]Error: {e}[/red]")
+
+    def __check_balance(self, account_name: str) -> None:
+        """
+        Show the balance of the current account.
+
+        :param account_name: The name of the current account
+        :type account_name: str
+        """
+
+        self.console.print(
+            f"[blue]Current balance: {self.current_account.balance:.2f} {self.current_account.currency}[/blue]"
+        )
+
+    def __change_interest_rate(self, account_name: str) -> None:
+        """
+        Change the interest rate of the current account.
+
+        :param account_name: The name of the current account
+        :type account_name: str
+        """
+
+        try:
+            new_rate = Prompt.ask("Enter new interest rate (e.g., 0.01 for 1%)")
+            self.current_account.set_interest_rate(new_rate)
+            self.console.print(f"[green]Interest rate changed to {self.current_account.interest_rate}[/green]")
+        except InvalidOperation:
+            self.console.print("[red]Error: Please enter a valid interest rate[/red]")
+        except ValueError as e:
+            self.console.print(f"[red]Error: {e}[/red]")
+
+    def __apply_monthly_interest(self, account_name: str) -> None:
+        """
+        Apply the monthly interest to the current account.
 
-            match action:
-                case "Deposit":
-                    try:
-                        amount = Prompt.ask("Enter amount to deposit")
-                        self.current_account.deposit(amount)
-                        print(f"[green]Successfully deposited {amount} {self.current_account.currency}[/green]")
-                    except ValueError as e:
-                        print(f"[red]Error: {e}[/red]")
-
-                case "Withdraw":
-                    try:
-                        amount = Prompt.ask("Enter amount to withdraw")
-                        self.current_account.withdraw(amount)
-                        print(f"[green]Successfully withdrew {amount} {self.current_account.currency}[/green]")
-                    except ValueError as e:
-                        print(f"[red]Error: {e}[/red]")
-
-                case "Check balance":
-                    print(
-                        f"[blue]Current balance: {self.current_account.balance:.2f} {self.current_account.currency}[/blue]"
-                    )
-
-                case "Change interest Rate":
-                    try:
-                        new_rate = Prompt.ask("Enter new interest rate (e.g., 0.01 for 1%)")
-                        self.current_account.set_interest_rate(new_rate)
-                        print(f"[green]Interest rate changed to {self.current_account.interest_rate}[/green]")
-                    except ValueError as e:
-                        print(f"[red]Error: {e}[/red]")
-
-                case "Apply monthly interest":
-                    self.current_account.apply_monthly_interest()
-                    print(
-                        f"[green]Monthly interest applied. New balance: {self.current_account.balance:.2f} {self.current_account.currency}[/green]"
-                    )
-
-                case "Close account":
-                    confirm = Prompt.ask("Are you sure you want to close this account?", choices=["yes", "no"])
-                    if confirm == "yes":
-                        self.current_account.close()
-                        print(f"[yellow]Account {account_name} has been closed.[/yellow]")
-
-                case "Reopen account":
-                    self.current_account.open()
-                    print(f"[green]Account {account_name} has been reopened.[/green]")
-
-                case "Add Owner":
-                    self.__add_account_owner(account_name)
-
-                case "Back to Main Menu":
-                    self.current_account = None
-                    break
+        :param account_name: The name of the current account
+        :type account_name: str
+        """
+
+        self.current_account.apply_monthly_interest()
+        self.console.print(
+            f"[green]Monthly interest applied. New balance: "
+            f"{self.current_account.balance:.2f} {self.current_account.currency}[/green]"
+        )
+
+    def __close_account(self, account_name: str) -> None:
+        """
+        Close the current account after a confirmation.
+
+        :param account_name: The name of the current account
+        :type account_name: str
+        """
+
+        confirm = Prompt.ask("Are you sure you want to close this account?", choices=["yes", "no"])
+        if confirm == "yes":
+            self.current_account.close()
+            self.console.print(f"[yellow]Account {account_name} has been closed.[/yellow]")
+
+    def __reopen_account(self, account_name: str) -> None:
+        """
+        Reopen the current account.
+
+        :param account_name: The name of the current account
+        :type account_name: str
+        """
+
+        self.current_account.open()
+        self.console.print(f"[green]Account {account_name} has been reopened.[/green]")
+
+    def __account_options(self, account: Union[SavingAccount, YouthAccount]) -> List[str]:
+        """
+        Get the menu options for an account, cached by account type and status.
+
+        :param account: The account to get the options for
+        :type account: Union[SavingAccount, YouthAccount]
+        :return: The options to choose from
+        :rtype: List[str]
+        """
+
+        key = (type(account), account.opened)
+        options = self._options_cache.get(key)
+        if options is None:
+            status_option = "Close Account" if account.opened else "Reopen Account"
+            interest_options = _INTEREST_OPTIONS if account.supports_interest else ()
+            options = [*_BASE_OPTIONS, *interest_options, status_option, "Add Owner", "Back to Main Menu"]
+            self._options_cache[key] = options
+        return options
 
     def __add_account_owner(self, account_name: str) -> None:
         """
@@ -184,7 +319,8 @@ class ClientAccounts:
             self.account_owners[account_name] = ["Primary Owner"]
 
         self.account_owners[account_name].append(new_owner)
-        print(f"[green]{new_owner} added as owner to account {account_name}[/green]")
+        self._row_cache.pop(account_name, None)
+        self.console.print(f"[green]{new_owner} added as owner to account {account_name}[/green]")
 
     def __add_account(self) -> None:
         """
@@ -198,12 +334,12 @@ class ClientAccounts:
 
         option = Prompt.ask("Which type of account?", choices=["Saving account", "Youth account"])
 
-        iban = "CH" + "".join(random.choices(string.digits, k=18)) + random.choice(string.ascii_uppercase)
+        iban = f"{_IBAN_PREFIX}{random.randrange(10**18):018d}{_UPPER[random.randrange(26)]}"
 
         match option:
             case "Saving account":
                 new_account = SavingAccount(iban)
-                print("[green]Saving account created successfully[/green]")
+                self.console.print("[green]Saving account created successfully[/green]")
 
             case "Youth account":
                 year = int(Prompt.ask("Enter birth year"))
@@ -213,17 +349,25 @@ class ClientAccounts:
                 try:
                     birth_date = date(year, month, day)
                     new_account = YouthAccount(iban, birth_date)
-                    print("[green]Youth account created successfully[/green]")
+                    self.console.print("[green]Youth account created successfully[/green]")
                 except ValueError as e:
-                    print(f"[red]Error creating youth account: {e}[/red]")
+                    self.console.print(f"[red]Error creating youth account: {e}[/red]")
                     return
 
         name_option = Prompt.ask("Name of account")
         if name_option in self.accounts:
-            print("[red]An account with this name already exists. Please choose a different name.[/red]")
+            self.console.print("[red]An account with this name already exists. Please choose a different name.[/red]")
             return
 
         self.accounts[name_option] = new_account
+        self._account_names.append(name_option)
+
+    def __tax_report(self) -> None:
+        """
+        Generate the tax report of all accounts.
+        """
+
+        TaxReport.generate(self)
 
     def run(self) -> None:
         """
@@ -237,31 +381,22 @@ class ClientAccounts:
         if self.__check_password(password):
             exit = False
         else:
-            print("[red]Authentication failed![/red]")
+            self.console.print("[red]Authentication failed![/red]")
             exit = True
 
         while not exit:
-            print("\n[bold]Bank Application[/bold]")
+            self.console.print("\n[bold]Bank Application[/bold]")
             if self.accounts:
-                print(f"You have {len(self.accounts)} account(s)")
+                self.console.print(f"You have {len(self.accounts)} account(s)")
+            else:
+                self.console.print("You have no accounts yet")
+
+            option = Prompt.ask("What would you like to do", choices=self._menu_options)
+
+            if option == "Exit":
+                exit = True
             else:
-                print("You have no accounts yet")
-
-            option = Prompt.ask(
-                "What would you like to do", choices=["Manage account", "Add account", "List accounts", "Tax report", "Exit"]
-            )
-
-            match option:
-                case "Manage account":
-                    self.__manage_account()
-                case "Add account":
-                    self.__add_account()
-                case "List accounts":
-                    self.display_accounts()
-                case "Tax report":
-                    TaxReport.generate(self)
-                case "Exit":
-                    exit = True
+                self._menu_actions[option]()
 
 
 if __name__ == "__main__":
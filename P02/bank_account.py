@@ -1,8 +1,86 @@
 from decimal import Decimal
+from typing import ClassVar
 
 # Using floats for calculations with currencies doesn't really make sense, as they aren't exact
 # as we learned in PROG1 with the 0.1 + 0.2 example.
 # After googling it turns out there's a builtin module called Decimal which is perfectly suitable for this excercise
+# Internally the amounts are kept as integer cents though, Decimal is only used to parse and display them.
+
+_MAX_BALANCE_CENTS = 10_000_000
+# interest rates are applied as integer millionths
+_RATE_SCALE = 1_000_000
+
+
+def _to_cents(amount: Decimal) -> int:
+    """
+    Convert an amount into integer cents.
+
+    :param amount: The amount to convert
+    :type amount: Decimal
+    :return: The amount in cents
+    :rtype: int
+    :raises ValueError: If the amount is not finite or has more than two decimal places
+    """
+
+    if not amount.is_finite():
+        raise ValueError("amount needs to be a finite number")
+    cents = amount * 100
+    if cents != cents.to_integral_value():
+        raise ValueError("amount can have at most two decimal places")
+    return int(cents)
+
+
+def _to_ppm(rate: Decimal) -> int:
+    """
+    Convert an interest rate into integer millionths.
+
+    :param rate: The interest rate to convert
+    :type rate: Decimal
+    :return: The rate in millionths
+    :rtype: int
+    :raises ValueError: If the rate is not finite, negative or has more than six decimal places
+    """
+
+    if not rate.is_finite():
+        raise ValueError("Interest rate needs to be a finite number")
+    if rate < 0:
+        raise ValueError("Interest rate cannot be negative")
+    rate_ppm = rate * _RATE_SCALE
+    if rate_ppm != rate_ppm.to_integral_value():
+        raise ValueError("Interest rate can have at most six decimal places")
+    return int(rate_ppm)
+
+
+def _from_cents(cents: int) -> Decimal:
+    """
+    Convert integer cents back into a Decimal amount.
+
+    :param cents: The amount in cents
+    :type cents: int
+    :return: The amount with two decimal places
+    :rtype: Decimal
+    """
+
+    return Decimal(cents).scaleb(-2)
+
+
+def _round_div(numerator: int, denominator: int) -> int:
+    """
+    Divide two integers and round half to even, the same as quantize does with the default Decimal context.
+
+    :param numerator: The numerator
+    :type numerator: int
+    :param denominator: The denominator, has to be positive
+    :type denominator: int
+    :return: The rounded quotient
+    :rtype: int
+    """
+
+    quotient, remainder = divmod(numerator, denominator)
+    doubled = 2 * remainder
+    if doubled > denominator or (doubled == denominator and quotient % 2):
+        quotient += 1
+    return quotient
 
 
 class BankAccount:
@@ -26,36 +104,40 @@ class BankAccount:
     :type min_balance: Decimal
     :ivar max_balance: Maximum balance allowed for the account
     :type max_balance: Decimal
+    :cvar supports_interest: Whether the account type pays interest
+    :type supports_interest: bool
     """
 
+    __slots__ = ("iban", "_currency", "opened", "_balance_cents", "_min_balance_cents", "_max_balance_cents")
+
+    supports_interest: ClassVar[bool] = False
+
     def __init__(self, iban: str, currency: str = "CHF") -> None:
 
         self.iban = iban
         self._currency = currency
         self.opened = True
-        self.balance = Decimal("0")
-        self.min_balance = Decimal("0")
-        self.max_balance = Decimal("100000")
+        self._balance_cents = 0
+        self._min_balance_cents = 0
+        self._max_balance_cents = _MAX_BALANCE_CENTS
 
-    def __validate_transaction(self, amount: str | Decimal) -> Decimal:
+    def _validate_transaction(self, amount: Decimal) -> int:
         """
         Validate a transaction amount.
 
         :param amount: The amount to validate
-        :type amount: str or Decimal
-        :return: The validated amount as a Decimal
-        :rtype: Decimal
-        :raises ValueError: If the account is closed or the amount is not positive
+        :type amount: Decimal
+        :return: The validated amount in cents
+        :rtype: int
+        :raises ValueError: If the account is closed or the amount is not a positive amount of whole cents
         """
 
-        if self.opened:
-            if isinstance(amount, str):
-                amount = Decimal(amount)
-            if amount <= 0:
-                raise ValueError("amount needs to be non-zero, positive number")
-            return amount
-        else:
+        if not self.opened:
             raise ValueError("Transactions not possible on closed account")
+        amount_cents = _to_cents(amount)
+        if amount_cents <= 0:
+            raise ValueError("amount needs to be non-zero, positive number")
+        return amount_cents
 
     @property
     def currency(self) -> str:
@@ -68,33 +150,66 @@ class BankAccount:
 
         return self._currency
 
-    def deposit(self, amount: str | Decimal) -> None:
+    @property
+    def balance(self) -> Decimal:
+        """
+        Get the current balance of the bank account.
+
+        :return: The balance
+        :rtype: Decimal
+        """
+
+        return _from_cents(self._balance_cents)
+
+    @property
+    def min_balance(self) -> Decimal:
+        """
+        Get the minimum balance allowed for the bank account.
+
+        :return: The minimum balance
+        :rtype: Decimal
+        """
+
+        return _from_cents(self._min_balance_cents)
+
+    @property
+    def max_balance(self) -> Decimal:
+        """
+        Get the maximum balance allowed for the bank account.
+
+        :return: The maximum balance
+        :rtype: Decimal
+        """
+
+        return _from_cents(self._max_balance_cents)
+
+    def deposit(self, amount: Decimal) -> None:
         """
         Deposit an amount into the account with all the necessary validators.
 
         :param amount: The amount to deposit
-        :type amount: str or Decimal
+        :type amount: Decimal
         :raises ValueError: If the deposit would exceed the maximum balance
         """
 
-        amount = self.__validate_transaction(amount)
-        if self.balance + amount <= self.max_balance:
-            self.balance += amount
+        amount_cents = self._validate_transaction(amount)
+        if self._balance_cents + amount_cents <= self._max_balance_cents:
+            self._balance_cents += amount_cents
         else:
             raise ValueError("Cannot deposit, maximum balance amount would be reached")
 
-    def withdraw(self, amount: str | Decimal) -> None:
+    def withdraw(self, amount: Decimal) -> None:
         """
         Withdraw an amount from the account with all the necessary validators.
 
         :param amount: The amount to withdraw
-        :type amount: str or Decimal
+        :type amount: Decimal
         :raises ValueError: If the withdrawal would go below the minimum balance
         """
 
-        amount = self.__validate_transaction(amount)
-        if self.balance - amount >= self.min_balance:
-            self.balance -= amount
+        amount_cents = self._validate_transaction(amount)
+        if self._balance_cents - amount_cents >= self._min_balance_cents:
+            self._balance_cents -= amount_cents
         else:
             raise ValueError("Cannot withdraw, minimum balance amount would be reached")
 
@@ -113,3 +228,59 @@ class BankAccount:
 
         if not self.opened:
             self.opened = True
+
+
+class InterestAccount(BankAccount):
+    """
+    A base class for bank accounts that pay a monthly interest.
+
+    The rate is kept as integer millionths, the interest is rounded half to even to whole cents every month.
+
+    :ivar interest_rate: Interest rate of the account
+    :type interest_rate: Decimal
+    :cvar supports_interest: Whether the account type pays interest
+    :type supports_interest: bool
+    """
+
+    __slots__ = ("interest_rate", "_rate_ppm")
+
+    supports_interest: ClassVar[bool] = True
+
+    def set_interest_rate(self, rate: str | Decimal) -> None:
+        """
+        Change the monthly interest rate.
+
+        :param rate: The new interest rate as a string or Decimal
+        :type rate: str | Decimal
+        :raises ValueError: If the interest rate is not finite, negative or has more than six decimal places
+        """
+
+        if isinstance(rate, str):
+            rate = Decimal(rate)
+        self._rate_ppm = _to_ppm(rate)
+        self.interest_rate = rate
+
+    def apply_monthly_interest(self) -> None:
+        """
+        Apply the monthly interest to the account balance.
+        """
+
+        if self.opened:
+            self._balance_cents += _round_div(self._balance_cents * self._rate_ppm, _RATE_SCALE)
+
+    def apply_compound_interest(self, months: int) -> None:
+        """
+        Apply the monthly interest for several months at once.
+
+        Every month is still rounded to cents, the result is the same as applying the monthly interest months times.
+
+        :param months: Number of months to apply
+        :type months: int
+        """
+
+        if self.opened:
+            balance_cents = self._balance_cents
+            rate_ppm = self._rate_ppm
+            for _ in range(months):
+                balance_cents += _round_div(balance_cents * rate_ppm, _RATE_SCALE)
+            self._balance_cents = balance_cents
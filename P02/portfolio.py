@@ -0,0 +1,148 @@
+import importlib.util
+
+import numpy as np
+
+from .bank_account import _RATE_SCALE
+from .saving_account import SavingAccount
+from .youth_account import YouthAccount
+
+
+def _round_div(numerator: np.ndarray, denominator: int) -> np.ndarray:
+    """
+    Divide an integer array and round half to even, like the scalar _round_div of the bank accounts.
+
+    :param numerator: The numerators
+    :type numerator: np.ndarray
+    :param denominator: The denominator, has to be positive
+    :type denominator: int
+    :return: The rounded quotients
+    :rtype: np.ndarray
+    """
+
+    quotient, remainder = np.divmod(numerator, denominator)
+    doubled = 2 * remainder
+    quotient += (doubled > denominator) | ((doubled == denominator) & (quotient % 2 == 1))
+    return quotient
+
+
+def _compound_np(balance_cents: np.ndarray, rate_ppm: np.ndarray, opened: np.ndarray, months: int) -> None:
+    """
+    Apply the monthly interest for several months in place, month by month so every month is rounded to cents.
+
+    :param balance_cents: Balances of the accounts in cents, updated in place
+    :type balance_cents: np.ndarray
+    :param rate_ppm: Interest rates of the accounts in millionths
+    :type rate_ppm: np.ndarray
+    :param opened: Status of the accounts (open or closed)
+    :type opened: np.ndarray
+    :param months: Number of months to apply
+    :type months: int
+    """
+
+    for _ in range(months):
+        interest = _round_div(balance_cents * rate_ppm, _RATE_SCALE)
+        balance_cents += np.where(opened, interest, 0)
+
+
+# Numba is optional, if it's installed the kernel is compiled to native code and runs in parallel over the accounts
+HAVE_NUMBA = importlib.util.find_spec("numba") is not None
+# below this many accounts the compiled kernel doesn't pay off, the NumPy version is used instead
+JIT_MIN_ACCOUNTS = 1000
+
+if HAVE_NUMBA:
+    from numba import njit, prange
+
+    @njit(parallel=True, cache=True)
+    def _compound_jit(balance_cents, rate_ppm, opened, months):
+        for i in prange(balance_cents.size):
+            if opened[i]:
+                balance = balance_cents[i]
+                rate = rate_ppm[i]
+                for _ in range(months):
+                    quotient, remainder = divmod(balance * rate, _RATE_SCALE)
+                    doubled = 2 * remainder
+                    if doubled > _RATE_SCALE or (doubled == _RATE_SCALE and quotient % 2 == 1):
+                        quotient += 1
+                    balance += quotient
+                balance_cents[i] = balance
+
+
+class BankPortfolio:
+    """
+    A class to apply monthly interest to many accounts at once.
+
+    The balances, rates and status of the accounts are copied into arrays (structure of arrays),
+    so the interest of all accounts is calculated with a few vectorized operations instead of
+    a Python loop. The accounts themselves are only updated again by :meth:`sync`.
+
+    :param accounts: The accounts of the portfolio
+    :type accounts: list[SavingAccount | YouthAccount]
+    :ivar accounts: The accounts of the portfolio
+    :type accounts: list[SavingAccount | YouthAccount]
+    :ivar balance_cents: Balances of the accounts in cents
+    :type balance_cents: np.ndarray
+    :ivar rate_ppm: Interest rates of the accounts in millionths
+    :type rate_ppm: np.ndarray
+    :ivar opened: Status of the accounts (open or closed)
+    :type opened: np.ndarray
+    """
+
+    def __init__(self, accounts: list[SavingAccount | YouthAccount]) -> None:
+        self.accounts = list(accounts)
+        count = len(self.accounts)
+        self.balance_cents = np.fromiter((account._balance_cents for account in self.accounts), np.int64, count)
+        self.rate_ppm = np.fromiter((account._rate_ppm for account in self.accounts), np.int64, count)
+        self.opened = np.fromiter((account.opened for account in self.accounts), np.bool_, count)
+
+    def apply_monthly_interest_all(self, months: int = 1) -> None:
+        """
+        Apply the monthly interest to all open accounts of the portfolio.
+
+        :param months: Number of months to apply, defaults to 1
+        :type months: int
+        """
+
+        use_jit = HAVE_NUMBA and self.balance_cents.size >= JIT_MIN_ACCOUNTS
+        compound = _compound_jit if use_jit else _compound_np
+        compound(self.balance_cents, self.rate_ppm, self.opened, months)
+
+    def sync(self) -> None:
+        """
+        Write the balances of the portfolio back to the accounts.
+        """
+
+        for account, balance_cents in zip(self.accounts, self.balance_cents.tolist(), strict=True):
+            account._balance_cents = balance_cents
+
+
+if __name__ == "__main__":
+    # Check the portfolio against the single accounts, and the Numba kernel against the NumPy version
+    import random
+    from decimal import Decimal
+
+    accounts = []
+    for i in range(1000):
+        account = SavingAccount(f"CH{i:010d}")
+        account.deposit(Decimal(random.randint(1, 5_000_000)).scaleb(-2))
+        account.withdraw(Decimal(random.randint(1, 5_000_000)).scaleb(-2))
+        account.set_interest_rate(Decimal(random.randint(0, 50_000)).scaleb(-6))
+        if random.random() < 0.1:
+            account.close()
+        accounts.append(account)
+
+    portfolio = BankPortfolio(accounts)
+    expected = portfolio.balance_cents.copy()
+    _compound_np(expected, portfolio.rate_ppm, portfolio.opened, 24)
+    if HAVE_NUMBA:
+        jit_balances = portfolio.balance_cents.copy()
+        _compound_jit(jit_balances, portfolio.rate_ppm, portfolio.opened, 24)
+        print(f"Numba and NumPy kernels identical: {np.array_equal(jit_balances, expected)}")
+    else:
+        print("Numba is not installed, only the NumPy kernel is checked")
+
+    portfolio.apply_monthly_interest_all(24)
+    for account in accounts:
+        account.apply_compound_interest(24)
+    single_balances = [account._balance_cents for account in accounts]
+    identical = portfolio.balance_cents.tolist() == single_balances == expected.tolist()
+    print(f"Portfolio identical to single accounts: {identical}")
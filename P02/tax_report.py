@@ -1,5 +1,8 @@
-from rich.table import Table as RichTable
+from collections import defaultdict
 from datetime import datetime
+from decimal import Decimal
+
+from rich.table import Table as RichTable
 
 
 class TaxReport:
@@ -17,18 +20,23 @@ class TaxReport:
             bank_application.console.print(f"\n[bold]Tax Report {datetime.now().year} for Fiscal Year {datetime.now().year - 1}[/bold]\n", style="underline")
             bank_application.display_accounts()
 
-            currency_totals = {}
+            currency_totals = defaultdict(Decimal)
             for account in bank_application.accounts.values():
-                currency_totals[account.currency] = currency_totals.get(account.currency, 0) + account.balance
-
-            # Create a table for total wealth grouped by currency
-            currency_table = RichTable(title="Total Wealth by Currency", title_justify="left")
-            currency_table.add_column("Currency")
-            currency_table.add_column("Total Amount")
-
-            for currency, total in currency_totals.items():
-                currency_table.add_row(currency, f"{total:.2f}")
-
-            bank_application.console.print(currency_table)
+                currency_totals[account.currency] += account.balance
+
+            if len(currency_totals) == 1:
+                # A single currency doesn't need a table
+                ((currency, total),) = currency_totals.items()
+                bank_application.console.print(f"Total Wealth in {currency}: {total:.2f}")
+            else:
+                # Create a table for total wealth grouped by currency
+                currency_table = RichTable(title="Total Wealth by Currency", title_justify="left")
+                currency_table.add_column("Currency")
+                currency_table.add_column("Total Amount")
+
+                for currency, total in currency_totals.items():
+                    currency_table.add_row(currency, f"{total:.2f}")
+
+                bank_application.console.print(currency_table)
         else:
             bank_application.console.print("[yellow]No accounts available.[/yellow]")
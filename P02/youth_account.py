@@ -1,10 +1,14 @@
 from datetime import date, datetime
 from decimal import Decimal
+from typing import ClassVar
 
-from .bank_account import BankAccount
+from .bank_account import InterestAccount, _from_cents
 
+_INTEREST_RATE = Decimal("0.02")
+_MONTHLY_WITHDRAW_LIMIT_CENTS = 200_000
 
-class YouthAccount(BankAccount):
+
+class YouthAccount(InterestAccount):
     """
     A class to manage a youth bank account.
 
@@ -28,8 +32,21 @@ class YouthAccount(BankAccount):
     :type withdraw_this_month: Decimal
     :ivar last_withdraw_month: The month of the last withdrawal
     :type last_withdraw_month: int
+    :cvar type_name: Display name of the account type
+    :type type_name: str
+    :cvar supports_interest: Whether the account type pays interest
+    :type supports_interest: bool
     """
 
+    __slots__ = (
+        "birth_date",
+        "_monthly_withdraw_limit_cents",
+        "_withdraw_this_month_cents",
+        "last_withdraw_month",
+    )
+
+    type_name: ClassVar[str] = "Youth Account"
+
     def __init__(self, iban: str, birth_date: date, currency: str = "CHF") -> None:
         """
         Initialize a youth account with age verification.
@@ -45,65 +62,64 @@ class YouthAccount(BankAccount):
 
         super().__init__(iban, currency)
 
-        age = datetime.now().year - birth_date.year
+        now = datetime.now()
+        age = now.year - birth_date.year
         if age > 25:
             raise ValueError("Youth accounts can only be opened by person aged 25 or younger")
 
         self.birth_date = birth_date
-        self.interest_rate = Decimal("0.02")
-        self.monthly_withdraw_limit = Decimal("2000")
-        self.withdraw_this_month = Decimal("0")
-        self.last_withdraw_month = datetime.now().month
+        self.set_interest_rate(_INTEREST_RATE)
+        self._monthly_withdraw_limit_cents = _MONTHLY_WITHDRAW_LIMIT_CENTS
+        self._withdraw_this_month_cents = 0
+        self.last_withdraw_month = now.month
 
-    def set_interest_rate(self, rate: str | Decimal) -> None:
+    @property
+    def monthly_withdraw_limit(self) -> Decimal:
         """
-        Change the monthly interest rate.
+        Get the monthly withdrawal limit of the account.
 
-        :param rate: The new interest rate as a string or Decimal
-        :type rate: str | Decimal
-        :raises ValueError: If the interest rate is negative
+        :return: The monthly withdrawal limit
+        :rtype: Decimal
         """
 
-        if isinstance(rate, str):
-            rate = Decimal(rate)
-        if rate < 0:
-            raise ValueError("Interest rate cannot be negative")
-        self.interest_rate = rate
+        return _from_cents(self._monthly_withdraw_limit_cents)
 
-    def apply_monthly_interest(self) -> None:
+    @property
+    def withdraw_this_month(self) -> Decimal:
         """
-        Apply the monthly interest to the account balance.
+        Get the amount withdrawn in the current month.
+
+        :return: The amount withdrawn this month
+        :rtype: Decimal
         """
 
-        if self.opened:
-            interest = (self.balance * self.interest_rate).quantize(Decimal("0.01"))
-            self.balance += interest
+        return _from_cents(self._withdraw_this_month_cents)
 
-    def withdraw(self, amount: str | Decimal) -> Decimal:
+    def withdraw(self, amount: Decimal) -> Decimal:
         """
         Withdraw an amount from the account with monthly limit check.
 
-        :param amount: The amount to withdraw as a string or Decimal
-        :type amount: str | Decimal
+        :param amount: The amount to withdraw
+        :type amount: Decimal
         :return: The withdrawn amount
         :rtype: Decimal
         :raises ValueError: If the monthly withdrawal limit is exceeded or if the minimum balance would be reached
         """
 
-        amount = self._BankAccount__validate_transaction(amount)
+        amount_cents = self._validate_transaction(amount)
 
         current_month = datetime.now().month
         if current_month != self.last_withdraw_month:
-            self.withdraw_this_month = Decimal("0")
+            self._withdraw_this_month_cents = 0
             self.last_withdraw_month = current_month
 
-        if self.withdraw_this_month + amount > self.monthly_withdraw_limit:
+        if self._withdraw_this_month_cents + amount_cents > self._monthly_withdraw_limit_cents:
             raise ValueError(f"Monthly withdrawal limit of {self.monthly_withdraw_limit} {self.currency} exceeded")
 
-        if self.balance - amount >= self.min_balance:
-            self.balance -= amount
-            self.withdraw_this_month += amount
-            return amount
+        if self._balance_cents - amount_cents >= self._min_balance_cents:
+            self._balance_cents -= amount_cents
+            self._withdraw_this_month_cents += amount_cents
+            return _from_cents(amount_cents)
         else:
             raise ValueError("Cannot withdraw, minimum balance amount would be reached")
 
@@ -116,7 +132,7 @@ if __name__ == "__main__":
     print(f"Initial balance: {youth_account.balance} {youth_account.currency}")
 
     # Deposit some money
-    youth_account.deposit("5000")
+    youth_account.deposit(Decimal("5000"))
     print(f"After deposit: {youth_account.balance} {youth_account.currency}")
 
     # Apply monthly interest
@@ -124,13 +140,13 @@ if __name__ == "__main__":
     print(f"After interest: {youth_account.balance} {youth_account.currency}")
 
     # Try to withdraw within the monthly limit
-    youth_account.withdraw("1500")
+    youth_account.withdraw(Decimal("1500"))
     print(f"After withdrawal: {youth_account.balance} {youth_account.currency}")
     print(f"Withdrawn this month: {youth_account.withdraw_this_month} {youth_account.currency}")
 
     try:
         # Try to withdraw more than the monthly limit
-        youth_account.withdraw("1000")
+        youth_account.withdraw(Decimal("1000"))
     except ValueError as e:
         print(f"Error: {e}")
 
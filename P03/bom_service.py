@@ -6,6 +6,8 @@ from requests.adapters import HTTPAdapter, Retry
 from rich.console import Console
 from rich.table import Table as RichTable
 
+_CONSOLE = Console()
+
 
 class Car(BaseModel):
     """
@@ -55,7 +57,11 @@ class Car(BaseModel):
 
         table.add_row("Total", str(sum(model_dict.values())))
 
-        Console().print(table)
+        _CONSOLE.print(table)
+
+
+# The server sends the UTF-8 keys decoded as Latin-1 (e.g. "RadaufhÃ¤ngung"), this maps them back to the aliases of Car
+_KEY_FIX = {field.alias.encode("utf-8").decode("latin-1"): field.alias for field in Car.model_fields.values()}
 
 
 class BomService:
@@ -64,19 +70,22 @@ class BomService:
 
     :param url: The URL of the remote server.
     :type url: str
+    :param timeout: Timeout of a request in seconds, defaults to 5.
+    :type timeout: float, optional
     """
 
-    def __init__(self, url: str) -> None:
+    def __init__(self, url: str, timeout: float = 5.0) -> None:
         self.url = url
+        self.timeout = timeout
+        # The session keeps its connections alive, the same pooled adapter is used for http and https
         self.session = rq.Session()
-        self.session.mount(
-            "http://",
-            HTTPAdapter(
-                max_retries=Retry(
-                    total=5, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504]
-                )
-            ),
+        adapter = HTTPAdapter(
+            max_retries=Retry(
+                total=5, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504]
+            )
         )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
     @staticmethod
     def _decode_keys(json: dict[str, Any]) -> dict[str, Any]:
@@ -89,13 +98,7 @@ class BomService:
         :rtype: dict[str, Any]
         """
 
-        for key in list(json.keys()):
-            try:
-                json[key.encode("latin-1").decode("utf-8")] = json.pop(key)
-            except UnicodeDecodeError:
-                pass
-
-        return json
+        return {_KEY_FIX.get(key, key): value for key, value in json.items()}
 
     def get_car(self) -> Car:
         """
@@ -105,7 +108,7 @@ class BomService:
         :rtype: Car
         """
 
-        resp = self.session.get(self.url)
+        resp = self.session.get(self.url, timeout=self.timeout)
 
         json = resp.json()
         json = self._decode_keys(json)
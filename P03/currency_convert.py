@@ -1,4 +1,7 @@
+import functools
+import os
 import os.path as op
+import shutil
 import urllib.request
 from datetime import date
 from decimal import Decimal
@@ -7,19 +10,55 @@ from decimal import Decimal
 from currency_converter import ECB_URL, CurrencyConverter
 
 
+@functools.lru_cache(maxsize=4)
+def _ensure_ecb(day: str) -> str:
+    """
+    Download the ECB rate file of a day if it doesn't exist yet, checked once per day and process.
+
+    :param day: The day in the format YYYYMMDD
+    :type day: str
+    :return: The name of the rate file
+    :rtype: str
+    """
+
+    filename = f"ecb_{day}.zip"
+    if not op.isfile(filename):
+        # Streamed in 1 MiB chunks into a .part file, so an aborted download isn't taken for the file of the day
+        with urllib.request.urlopen(ECB_URL) as response, open(f"{filename}.part", "wb") as file:
+            shutil.copyfileobj(response, file, length=1024 * 1024)
+        os.replace(f"{filename}.part", filename)
+    return filename
+
+
 class CustomCurrencyConverter(CurrencyConverter):
     """
     Custom currency converter that extends CurrencyConverter to simplify CHF conversions.
 
     :ivar filename: The name of the downloaded currency exchange rate file
     :type filename: str
+    :ivar _chf_rates: Rate of each source currency to CHF, filled on first use of a currency
+    :type _chf_rates: dict[str, Decimal]
     """
 
     def __init__(self):
-        filename = f"ecb_{date.today():%Y%m%d}.zip"
-        if not op.isfile(filename):
-            urllib.request.urlretrieve(ECB_URL, filename)
+        filename = _ensure_ecb(f"{date.today():%Y%m%d}")
         super().__init__(currency_file=filename, decimal=True)
+        self._chf_rates: dict[str, Decimal] = {}
+
+    def _chf_rate(self, source_curr: str) -> Decimal:
+        """
+        Get the rate from a source currency to CHF, it's looked up in the ECB table once per currency.
+
+        :param source_curr: The source currency code (e.g., 'USD', 'EUR')
+        :type source_curr: str
+        :return: The amount in CHF of one unit of the source currency
+        :rtype: Decimal
+        """
+
+        rate = self._chf_rates.get(source_curr)
+        if rate is None:
+            rate = self._chf_rates[source_curr] = self.convert(Decimal(1), currency=source_curr, new_currency="CHF")
+        return rate
 
     def convert_to_chf(self, amount: Decimal, source_curr: str) -> Decimal:
         """
@@ -33,9 +72,50 @@ class CustomCurrencyConverter(CurrencyConverter):
         :rtype: Decimal
         """
 
-        return self.convert(amount, currency=source_curr, new_currency="CHF")
+        return amount * self._chf_rate(source_curr)
+
+    def convert_many_to_chf(self, amounts: list[Decimal], source_currs: list[str]) -> list[Decimal]:
+        """
+        Convert several amounts to Swiss Francs (CHF), the rate of every currency is only looked up once.
+
+        :param amounts: The amounts to convert
+        :type amounts: list[Decimal]
+        :param source_currs: The source currency code of each amount
+        :type source_currs: list[str]
+        :return: The equivalent amounts in CHF
+        :rtype: list[Decimal]
+        """
+
+        chf_rate = self._chf_rate
+        return [amount * chf_rate(source_curr) for amount, source_curr in zip(amounts, source_currs)]
+
+
+@functools.cache
+def get_converter() -> CustomCurrencyConverter:
+    """
+    Get the converter of the process, the rate file is downloaded and parsed on the first call only.
+
+    :return: The shared currency converter
+    :rtype: CustomCurrencyConverter
+    """
+
+    return CustomCurrencyConverter()
+
+
+def convert_to_chf(amount: Decimal, source_curr: str) -> Decimal:
+    """
+    Convert an amount from a source currency to Swiss Francs (CHF) with the shared converter.
+
+    :param amount: The amount to convert
+    :type amount: Decimal
+    :param source_curr: The source currency code (e.g., 'USD', 'EUR')
+    :type source_curr: str
+    :return: The equivalent amount in CHF
+    :rtype: Decimal
+    """
+
+    return get_converter().convert_to_chf(amount, source_curr)
 
 
 if __name__ == "__main__":
-    c = CustomCurrencyConverter()
-    c.convert_to_chf(1, "USD")
+    print(convert_to_chf(Decimal(1), "USD"))
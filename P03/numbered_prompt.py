@@ -11,13 +11,17 @@ class NumberedPrompt(Prompt):
                 self.console.print(f"  {i}. {choice}")
 
     def process_response(self, value: str) -> str:
-        """Handle selection by number or by name."""
+        """Handle selection by number or by name, numbers are resolved by index first."""
         value = value.strip()
 
-        if value.isdigit() and self.choices:
-            index = int(value) - 1
-            if 0 <= index < len(self.choices):
-                return self.choices[index]
-            raise InvalidResponse(f"Please enter a number between 1 and {len(self.choices)}")
+        if self.choices:
+            if value.isdigit():
+                index = int(value) - 1
+                if 0 <= index < len(self.choices):
+                    return self.choices[index]
+                raise InvalidResponse(f"Please enter a number between 1 and {len(self.choices)}")
+
+            if value in self.choices:
+                return value
 
         return super().process_response(value)
@@ -1,9 +1,14 @@
 from decimal import Decimal
+from typing import ClassVar
 
-from .bank_account import BankAccount
+from .bank_account import InterestAccount, _from_cents, _round_div
 
+_INTEREST_RATE = Decimal("0.001")
+_MIN_BALANCE_CENTS = -10_000_000
+_OVERDRAFT_CHARGE_PERCENT = 2
 
-class SavingAccount(BankAccount):
+
+class SavingAccount(InterestAccount):
     """
     A class to manage a bank account.
 
@@ -26,59 +31,42 @@ class SavingAccount(BankAccount):
     :type max_balance: Decimal
     :ivar interest_rate: Interest rate of the account
     :type interest_rate: Decimal
+    :cvar type_name: Display name of the account type
+    :type type_name: str
+    :cvar supports_interest: Whether the account type pays interest
+    :type supports_interest: bool
     """
 
-    def __init__(self, iban: str, currency: str = "CHF") -> None:
-        super().__init__(iban, currency)
-        self.interest_rate: Decimal = Decimal("0.001")
-        self.min_balance: Decimal = Decimal("-100000")
-
-    def set_interest_rate(self, rate: str | Decimal) -> None:
-        """
-        Change the monthly interest rate.
-
-        :param rate: The new interest rate as a string or Decimal
-        :type rate: str | Decimal
-        :raises ValueError: If the interest rate is negative
-        """
-
-        if isinstance(rate, str):
-            rate = Decimal(rate)
-        if rate < 0:
-            raise ValueError("Interest rate cannot be negative")
-        self.interest_rate = rate
+    __slots__ = ()
 
-    def apply_monthly_interest(self) -> None:
-        """
-        Apply the monthly interest to the account balance.
-        """
+    type_name: ClassVar[str] = "Saving Account"
 
-        if self.opened:
-            interest = (self.balance * self.interest_rate).quantize(Decimal("0.01"))
-            self.balance += interest
+    def __init__(self, iban: str, currency: str = "CHF") -> None:
+        super().__init__(iban, currency)
+        self._min_balance_cents = _MIN_BALANCE_CENTS
+        self.set_interest_rate(_INTEREST_RATE)
 
-    def withdraw(self, amount: str | Decimal) -> Decimal:
+    def withdraw(self, amount: Decimal) -> Decimal:
         """
         Withdraw an amount from the account with all the necessary validators.
         Applies a 2% charge if balance is below zero after withdrawal.
 
-        :param amount: The amount to withdraw as a string or Decimal
-        :type amount: str | Decimal
+        :param amount: The amount to withdraw
+        :type amount: Decimal
         :return: The withdrawn amount
         :rtype: Decimal
         :raises ValueError: If the minimum balance would be reached
         """
 
-        amount = self._BankAccount__validate_transaction(amount)
+        amount_cents = self._validate_transaction(amount)
 
-        if self.balance - amount >= self.min_balance:
-            self.balance -= amount
+        if self._balance_cents - amount_cents >= self._min_balance_cents:
+            self._balance_cents -= amount_cents
 
-            if self.balance < 0:
-                charge = abs(self.balance) * Decimal("0.02")
-                self.balance -= charge
+            if self._balance_cents < 0:
+                self._balance_cents -= _round_div(-self._balance_cents * _OVERDRAFT_CHARGE_PERCENT, 100)
 
-            return amount
+            return _from_cents(amount_cents)
         else:
             raise ValueError("Cannot withdraw, minimum balance amount would be reached")
 
@@ -88,7 +76,7 @@ if __name__ == "__main__":
     print(f"Initial balance: {saving_account.balance} {saving_account.currency}")
 
     # Deposit some money
-    saving_account.deposit("1000")
+    saving_account.deposit(Decimal("1000"))
     print(f"After deposit: {saving_account.balance} {saving_account.currency}")
 
     # Apply monthly interest
@@ -96,7 +84,7 @@ if __name__ == "__main__":
     print(f"After interest: {saving_account.balance} {saving_account.currency}")
 
     # Withdraw more than the balance
-    saving_account.withdraw("1100")
+    saving_account.withdraw(Decimal("1100"))
     print(f"After withdrawal (with negative balance): {saving_account.balance} {saving_account.currency}")
 
     # Change interest rate
@@ -1,10 +1,14 @@
 from datetime import date, datetime, timedelta
+from decimal import Decimal
 
-from freezegun import freeze_time
+import time_machine
 
 from .saving_account import SavingAccount
 from .youth_account import YouthAccount
 
+# below this many accounts the interest is applied account by account, the arrays of a portfolio don't pay off
+_BATCH_MIN_ACCOUNTS = 1000
+
 
 class BankSimulation:
     """
@@ -24,8 +28,8 @@ class BankSimulation:
         birth_date: date = date(datetime.now().year - 20, 1, 1)
         self.youth_account: YouthAccount = YouthAccount("CH5432109876", birth_date)
 
-        self.saving_account.deposit("2000")
-        self.youth_account.deposit("500")
+        self.saving_account.deposit(Decimal("2000"))
+        self.youth_account.deposit(Decimal("500"))
 
         self.current_date: datetime = datetime.now()
 
@@ -45,11 +49,30 @@ class BankSimulation:
 
         self.current_date += timedelta(days=30)
 
-        self.saving_account.apply_monthly_interest()
-        self.youth_account.apply_monthly_interest()
+        self.apply_monthly_interest_batch([self.saving_account, self.youth_account])
 
         print(f"\nOne month has passed, new date: {self.current_date.strftime('%Y-%m-%d')}")
 
+    def apply_monthly_interest_batch(self, accounts: list[SavingAccount | YouthAccount]) -> None:
+        """
+        Apply the monthly interest to several accounts at once.
+
+        :param accounts: The accounts to apply the interest to
+        :type accounts: list[SavingAccount | YouthAccount]
+        """
+
+        if len(accounts) < _BATCH_MIN_ACCOUNTS:
+            for account in accounts:
+                account.apply_monthly_interest()
+            return
+
+        # only imported for large batches, it pulls in NumPy and Numba
+        from .portfolio import BankPortfolio
+
+        portfolio = BankPortfolio(accounts)
+        portfolio.apply_monthly_interest_all()
+        portfolio.sync()
+
     def run_simulation(self) -> None:
         """
         Run the bank account simulation for five months, performing various transactions and changes.
@@ -58,29 +81,31 @@ class BankSimulation:
         print("Starting bank account simulation...")
         self.print_account_status()
 
-        # Month 1
-        with freeze_time(self.current_date):
+        # The clock is only frozen once for the whole simulation and moved along with current_date,
+        # so the youth account sees the simulated month for its monthly withdrawal limit
+        with time_machine.travel(self.current_date, tick=False) as traveller:
+            # Month 1
             self.simulate_month()
             self.print_account_status()
 
-        # Month 2
-        with freeze_time(self.current_date):
+            # Month 2
+            traveller.move_to(self.current_date)
             print("\nMaking some transactions...")
-            self.saving_account.withdraw("2500")
-            self.youth_account.withdraw("100")
+            self.saving_account.withdraw(Decimal("2500"))
+            self.youth_account.withdraw(Decimal("100"))
 
             self.print_account_status()
             self.simulate_month()
             self.print_account_status()
 
-        # Month 3
-        with freeze_time(self.current_date):
+            # Month 3
+            traveller.move_to(self.current_date)
             print("\nMaking more transactions...")
-            self.saving_account.deposit("1000")
+            self.saving_account.deposit(Decimal("1000"))
 
             try:
-                self.youth_account.withdraw("1900")
-                self.youth_account.withdraw("200")
+                self.youth_account.withdraw(Decimal("1900"))
+                self.youth_account.withdraw(Decimal("200"))
             except ValueError as e:
                 print(f"Youth account error: {e}")
 
@@ -88,8 +113,8 @@ class BankSimulation:
             self.simulate_month()
             self.print_account_status()
 
-        # Month 4
-        with freeze_time(self.current_date):
+            # Month 4
+            traveller.move_to(self.current_date)
             print("\nChanging interest rates...")
             self.saving_account.set_interest_rate("0.002")
             self.youth_account.set_interest_rate("0.025")
@@ -97,8 +122,8 @@ class BankSimulation:
             self.simulate_month()
             self.print_account_status()
 
-        # Month 5
-        with freeze_time(self.current_date):
+            # Month 5
+            traveller.move_to(self.current_date)
             self.simulate_month()
             print("Simulation complete. Final account status:")
             self.print_account_status()
@@ -1,5 +1,8 @@
-from rich.table import Table as RichTable
+from collections import defaultdict
 from datetime import datetime
+from decimal import Decimal
+
+from rich.table import Table as RichTable
 
 class TaxReport:
     """
@@ -16,22 +19,33 @@ class TaxReport:
             bank_application.console.print(f"\n[bold]Tax Report {datetime.now().year} for Fiscal Year {datetime.now().year - 1}[/bold]\n", style="underline")
             bank_application.display_accounts()
 
-            currency_totals = {}
+            currency_totals = defaultdict(Decimal)
             for account in bank_application.accounts.values():
-                currency_totals[account.currency] = currency_totals.get(account.currency, 0) + account.balance
-
-            # Create a table for total wealth grouped by currency
-            currency_table = RichTable(title="Total Wealth by Currency", title_justify="left")
-            currency_table.add_column("Currency")
-            currency_table.add_column("Total Amount")
-            currency_table.add_column("Total Amount (in CHF)")
-
-            for currency, total in currency_totals.items():
-                currency_table.add_row(currency, f"{total:.2f}", f"{bank_application.currency_converter.convert_to_chf(total, currency):.2f} CHF")
-
-            bank_application.console.print(currency_table)
-
-            converted_total = sum([bank_application.currency_converter.convert_to_chf(total, currency) for currency, total in currency_totals.items()])
+                currency_totals[account.currency] += account.balance
+
+            converted_totals = bank_application.currency_converter.convert_many_to_chf(
+                list(currency_totals.values()), list(currency_totals)
+            )
+
+            if len(currency_totals) == 1:
+                # A single currency doesn't need a table
+                ((currency, total),) = currency_totals.items()
+                bank_application.console.print(
+                    f"Total Wealth in {currency}: {total:.2f} ({converted_totals[0]:.2f} CHF)"
+                )
+            else:
+                # Create a table for total wealth grouped by currency
+                currency_table = RichTable(title="Total Wealth by Currency", title_justify="left")
+                currency_table.add_column("Currency")
+                currency_table.add_column("Total Amount")
+                currency_table.add_column("Total Amount (in CHF)")
+
+                for (currency, total), converted in zip(currency_totals.items(), converted_totals):
+                    currency_table.add_row(currency, f"{total:.2f}", f"{converted:.2f} CHF")
+
+                bank_application.console.print(currency_table)
+
+            converted_total = sum(converted_totals)
             bank_application.console.print(f"[bold]Total: {converted_total:.2f} CHF[/bold]")
         else:
             bank_application.console.print("[yellow]No accounts available.[/yellow]")
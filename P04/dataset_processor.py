@@ -1,8 +1,32 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import pandas as pd
-import re
 import plotly.graph_objects as go
+from plotly.colors import qualitative
 from pyproj import Transformer
 
+LANGUAGE_SUFFIXES = ('_de', '_fr', '_it')
+# low-cardinality labels stored as categories and small time fields stored as narrow unsigned integers
+CATEGORICAL_COLS = (
+    'AccidentType', 'AccidentType_en',
+    'AccidentSeverityCategory', 'AccidentSeverityCategory_en',
+    'RoadType', 'RoadType_en',
+    'AccidentWeekDay', 'AccidentWeekDay_en',
+    'AccidentMonth_en', 'CantonCode', 'MunicipalityCode'
+)
+NUMERIC_COLS = ('AccidentYear', 'AccidentMonth', 'AccidentHour')
+# flags that come as 'true'/'false' strings in the dataset, they are stored as real booleans
+INVOLVEMENT_COLS = ('AccidentInvolvingPedestrian', 'AccidentInvolvingBicycle', 'AccidentInvolvingMotorcycle')
+# grid size per axis the heatmap points are binned to
+HEATMAP_BINS = 500
+# below this many points the projection is done in a single call, threads wouldn't pay off
+PROJECTION_CHUNK_SIZE = 100_000
+
+# CHLV95 to WGS84, the pipeline is only built once and shared by all threads
+_LV95_TO_WGS84 = Transformer.from_crs("EPSG:2056", "EPSG:4326", always_xy=True)
+
 
 class AccidentDataProcessor:
     def __init__(self, dataframe):
@@ -25,18 +49,67 @@ class AccidentDataProcessor:
         :rtype: pandas.DataFrame
         """
 
-        all_columns = self.raw_data.columns.tolist()
-        
-        columns_to_keep = []
-        for col in all_columns:
-            if not re.search(r'_(de|fr|it)$', col):
-                columns_to_keep.append(col)
+        columns_to_keep = ~self.raw_data.columns.str.endswith(LANGUAGE_SUFFIXES)
         
-        self.processed_data = self.raw_data[columns_to_keep].copy()
+        self.processed_data = self.raw_data.loc[:, columns_to_keep].copy()
+        self._latlon = None
+        self._downcast_dtypes()
     
-    def calculate_statistics(self):
+    def _downcast_dtypes(self):
         """
-        Calculate and print various statistics about the dataset
+        Convert the label columns to categories, the time columns to the smallest unsigned integer type
+        and the involvement flags to booleans
+        """
+
+        data = self.processed_data
+        for column in CATEGORICAL_COLS:
+            if column in data:
+                data[column] = data[column].astype('category')
+        for column in NUMERIC_COLS:
+            if column in data:
+                data[column] = pd.to_numeric(data[column], errors='coerce', downcast='unsigned')
+        for column in INVOLVEMENT_COLS:
+            if column in data and not pd.api.types.is_bool_dtype(data[column]):
+                data[column] = data[column].astype(str).str.lower().eq('true').to_numpy()
+    
+    def _english_labels(self, column):
+        """
+        Map every code of a column to its English label with a single groupby
+        
+        :param column: The column with the codes, the labels are in the column with the suffix _en
+        :type column: str
+        :return: The English label of every code
+        :rtype: pandas.Series
+        """
+
+        return self.processed_data.groupby(column, sort=False, observed=True)[f'{column}_en'].first()
+
+    def _hour_statistics(self):
+        """
+        Calculate the mean and median hour from a histogram of the hours, so the column is only scanned once
+        
+        :return: Mean and median hour of the accidents
+        :rtype: dict
+        """
+
+        hours = self.processed_data['AccidentHour'].dropna().to_numpy(dtype=np.int64)
+        # the hours are small integers, so counting them is all that's needed for both values
+        counts = np.bincount(hours, minlength=24)
+        total = len(hours)
+        if total == 0:
+            return {'mean': float('nan'), 'median': float('nan')}
+        cumulative = np.cumsum(counts)
+        lower, upper = np.searchsorted(cumulative, [(total - 1) // 2, total // 2], side='right')
+        
+        return {
+            'mean': np.round((counts @ np.arange(len(counts))) / total, 2),
+            'median': (lower + upper) / 2,
+        }
+
+    def compute_statistics(self):
+        """
+        Calculate various statistics about the dataset without printing them, the distributions are kept as
+        the pandas Series returned by value_counts
         
         :return: Dictionary containing the calculated statistics
         :rtype: dict
@@ -46,17 +119,7 @@ class AccidentDataProcessor:
         stats = {}
         
         stats['total_accidents'] = len(data)
-        print("\n===== ACCIDENT DATASET STATISTICS =====")
-        print(f"Total number of accidents: {stats['total_accidents']}")
-        
-        severity_counts = data['AccidentSeverityCategory'].value_counts()
-        severity_percentages = (severity_counts / stats['total_accidents'] * 100).round(1)
-        stats['severity_distribution'] = severity_counts.to_dict()
-        
-        print("\n----- Accident Severity -----")
-        for severity, count in severity_counts.items():
-            severity_name = data[data['AccidentSeverityCategory'] == severity]['AccidentSeverityCategory_en'].iloc[0]
-            print(f"{severity_name}: {count} accidents ({severity_percentages[severity]}%)")
+        stats['severity_distribution'] = data['AccidentSeverityCategory'].value_counts()
         
         vehicle_columns = {
             'Pedestrian': 'AccidentInvolvingPedestrian',
@@ -64,56 +127,112 @@ class AccidentDataProcessor:
             'Motorcycle': 'AccidentInvolvingMotorcycle'
         }
         
-        vehicle_stats = {}
-        print("\n----- Vehicle Involvement -----")
+        vehicle_counts = data[list(vehicle_columns.values())].sum()
+        stats['vehicle_involvement'] = {
+            vehicle_type: int(vehicle_counts[column]) for vehicle_type, column in vehicle_columns.items()
+        }
+        
+        stats['yearly_distribution'] = data['AccidentYear'].value_counts().sort_index()
+        stats['weekday_distribution'] = data['AccidentWeekDay'].value_counts()
         
-        for vehicle_type, column in vehicle_columns.items():
-            count = sum(1 for value in data[column] if value is True)
-            vehicle_stats[vehicle_type] = count
-            
-            percentage = round(count / stats['total_accidents'] * 100, 1)
-            print(f"Accidents involving {vehicle_type}: {count} ({percentage}%)")
+        stats['hour_statistics'] = self._hour_statistics()
+        
+        stats['road_type_distribution'] = data['RoadType'].value_counts()
+        
+        return stats
+    
+    def print_statistics(self, stats):
+        """
+        Print the statistics calculated by compute_statistics, the whole report is written at once
+        
+        :param stats: The statistics returned by compute_statistics
+        :type stats: dict
+        """
+
+        total = stats['total_accidents']
+        lines = [
+            "\n===== ACCIDENT DATASET STATISTICS =====",
+            f"Total number of accidents: {total}"
+        ]
         
-        stats['vehicle_involvement'] = vehicle_stats
+        severity_names = self._english_labels('AccidentSeverityCategory')
         
-        year_counts = data['AccidentYear'].value_counts().sort_index()
-        stats['yearly_distribution'] = year_counts.to_dict()
+        lines.append("\n----- Accident Severity -----")
+        for severity, count in stats['severity_distribution'].items():
+            percentage = round(count / total * 100, 1)
+            lines.append(f"{severity_names[severity]}: {count} accidents ({percentage}%)")
         
-        print("\n----- How many per year -----")
-        for year, count in year_counts.items():
-            print(f"Year {year}: {count} accidents")
+        lines.append("\n----- Vehicle Involvement -----")
+        for vehicle_type, count in stats['vehicle_involvement'].items():
+            percentage = round(count / total * 100, 1)
+            lines.append(f"Accidents involving {vehicle_type}: {count} ({percentage}%)")
         
-        weekday_counts = data['AccidentWeekDay'].value_counts()
-        stats['weekday_distribution'] = weekday_counts.to_dict()
+        lines.append("\n----- How many per year -----")
+        for year, count in stats['yearly_distribution'].items():
+            lines.append(f"Year {year}: {count} accidents")
         
-        print("\n----- How many on weekdays -----")
-        for weekday, count in weekday_counts.items():
-            weekday_name = data[data['AccidentWeekDay'] == weekday]['AccidentWeekDay_en'].iloc[0]
-            print(f"{weekday_name}: {count} accidents")
+        weekday_names = self._english_labels('AccidentWeekDay')
         
-        hour_numeric = pd.to_numeric(data['AccidentHour'], errors='coerce')
+        lines.append("\n----- How many on weekdays -----")
+        for weekday, count in stats['weekday_distribution'].items():
+            lines.append(f"{weekday_names[weekday]}: {count} accidents")
         
-        hour_stats = {
-            'mean': round(hour_numeric.mean(), 2),
-            'median': hour_numeric.median(),
-        }
-        stats['hour_statistics'] = hour_stats
+        hour_stats = stats['hour_statistics']
+        lines.append("\n----- Accident Hours -----")
+        lines.append(f"Mean hour: {hour_stats['mean']}")
+        lines.append(f"Median hour: {hour_stats['median']}")
         
-        print("\n----- Accident Hours -----")
-        print(f"Mean hour: {hour_stats['mean']}")
-        print(f"Median hour: {hour_stats['median']}")
+        road_names = self._english_labels('RoadType')
         
-        road_counts = data['RoadType'].value_counts()
-        stats['road_type_distribution'] = road_counts.to_dict()
+        lines.append("\n----- Road Types -----")
+        for road_type, count in stats['road_type_distribution'].head(5).items():
+            percentage = round(count / total * 100, 1)
+            lines.append(f"{road_names[road_type]}: {count} accidents ({percentage}%)")
         
-        print("\n----- Road Types -----")
-        for road_type, count in road_counts.head(5).items():
-            road_name = data[data['RoadType'] == road_type]['RoadType_en'].iloc[0]
-            percentage = round(count / stats['total_accidents'] * 100, 1)
-            print(f"{road_name}: {count} accidents ({percentage}%)")
+        print('\n'.join(lines))
+
+    def calculate_statistics(self):
+        """
+        Calculate and print various statistics about the dataset
         
+        :return: Dictionary containing the calculated statistics
+        :rtype: dict
+        """
+
+        stats = self.compute_statistics()
+        self.print_statistics(stats)
         return stats
         
+    def _ensure_latlon(self):
+        """
+        Add the WGS84 longitude and latitude columns to the processed data, they are only computed once
+        """
+
+        if self._latlon is not None:
+            return
+
+        eastings = self.processed_data['AccidentLocation_CHLV95_E'].to_numpy(dtype=float)
+        northings = self.processed_data['AccidentLocation_CHLV95_N'].to_numpy(dtype=float)
+        
+        # pyproj releases the GIL while transforming arrays, so large datasets are split into contiguous chunks
+        # that are transformed in parallel threads
+        n_chunks = min(os.cpu_count() or 1, -(-len(eastings) // PROJECTION_CHUNK_SIZE))
+        if n_chunks > 1:
+            with ThreadPoolExecutor(max_workers=n_chunks) as executor:
+                results = list(executor.map(
+                    _LV95_TO_WGS84.transform,
+                    np.array_split(eastings, n_chunks),
+                    np.array_split(northings, n_chunks)
+                ))
+            longitudes = np.concatenate([lons for lons, _ in results])
+            latitudes = np.concatenate([lats for _, lats in results])
+        else:
+            longitudes, latitudes = _LV95_TO_WGS84.transform(eastings, northings)
+        
+        self.processed_data['longitude'] = longitudes
+        self.processed_data['latitude'] = latitudes
+        self._latlon = (longitudes, latitudes)
+
     def visualize_data(self, viz_type):
         """
         Visualize accident locations with Plotly.
@@ -124,39 +243,53 @@ class AccidentDataProcessor:
         :rtype: plotly.graph_objects.Figure
         """
         
-        viz_data = self.processed_data.copy()
-        
-        # CHLV95 to WGS84
-        transformer = Transformer.from_crs("EPSG:2056", "EPSG:4326", always_xy=True)
-        
-        coordinates = [
-            transformer.transform(row.AccidentLocation_CHLV95_E, row.AccidentLocation_CHLV95_N) 
-            for _, row in viz_data.iterrows()
-        ]
-        
-        viz_data['longitude'] = [coord[0] for coord in coordinates]
-        viz_data['latitude'] = [coord[1] for coord in coordinates]
+        self._ensure_latlon()
+        viz_data = self.processed_data
         
         fig = go.Figure()
         
         if viz_type.lower() == 'scatter':
-            for severity in viz_data['AccidentSeverityCategory'].unique():
-                category_data = viz_data[viz_data['AccidentSeverityCategory'] == severity]
-                
+            # all points go into one trace, the severity only picks the marker color
+            severity = viz_data['AccidentSeverityCategory'].astype('category')
+            palette = np.array(qualitative.Plotly)
+            colors = palette[severity.cat.codes.to_numpy() % len(palette)]
+            
+            fig.add_trace(go.Scattermap(
+                lat=viz_data['latitude'],
+                lon=viz_data['longitude'],
+                mode='markers',
+                marker=dict(size=8, color=colors),
+                text=severity,
+                hoverinfo='text',
+                showlegend=False
+            ))
+            
+            # empty traces, only for the legend entries of the severities
+            for code, name in enumerate(severity.cat.categories):
                 fig.add_trace(go.Scattermap(
-                    lat=category_data['latitude'],
-                    lon=category_data['longitude'],
+                    lat=[None],
+                    lon=[None],
                     mode='markers',
-                    marker=dict(size=8),
-                    name=severity,
-                    hoverinfo='text'
+                    marker=dict(size=8, color=palette[code % len(palette)]),
+                    name=name
                 ))
             
         elif viz_type.lower() == 'heatmap':
+            # the accidents are counted on a grid first, plotly only gets the centers of the non-empty cells
+            longitudes, latitudes = self._latlon
+            # rows with missing coordinates can't be binned, they are left out like plotly does
+            finite = np.isfinite(longitudes) & np.isfinite(latitudes)
+            counts, lon_edges, lat_edges = np.histogram2d(
+                longitudes[finite], latitudes[finite], bins=HEATMAP_BINS
+            )
+            lon_index, lat_index = np.nonzero(counts)
+            lon_centers = (lon_edges[:-1] + lon_edges[1:]) / 2
+            lat_centers = (lat_edges[:-1] + lat_edges[1:]) / 2
+            
             fig.add_trace(go.Densitymap(
-                lat=viz_data['latitude'],
-                lon=viz_data['longitude'],
-                z=[1] * len(viz_data),
+                lat=lat_centers[lat_index],
+                lon=lon_centers[lon_index],
+                z=counts[lon_index, lat_index],
                 radius=10,
                 colorscale='Hot',
                 hoverinfo='none'
@@ -1,13 +1,15 @@
+import json
 import os
 import time
 from datetime import datetime
 
 import requests
 import pandas as pd
+import pyarrow.parquet as pq
 
 
 class DatasetDownloader:    
-    def __init__(self, url, cache_seconds=10):
+    def __init__(self, url, cache_seconds=10, columns=None):
         """
         Initialize the DatasetDownloader with a URL and cache period.
         
@@ -15,15 +17,22 @@ class DatasetDownloader:
         :type url: str
         :param cache_seconds: Seconds to keep the local file before re-downloading
         :type cache_seconds: int
+        :param columns: Columns to load, or a function selecting them by name, all columns if None
+        :type columns: list or callable, optional
         """
         
         self.url = url
         self.local_filename = os.path.basename(url)
+        self.meta_filename = f"{self.local_filename}.meta.json"
+        self.feather_filename = f"{self.local_filename}.feather"
         self.cache_seconds = cache_seconds
+        self.columns = columns
+        # one session for all requests, the connection is kept alive between downloads
+        self.session = requests.Session()
     
     def load_as_dataframe(self):
         """
-        Download the dataset if older than cache and load it as a pandas DataFrame.
+        Download the dataset if older than cache and changed on the server and load it as a pandas DataFrame.
         
         :return: DataFrame containing the dataset
         :rtype: pandas.DataFrame
@@ -37,13 +46,128 @@ class DatasetDownloader:
                 mtime_dt = datetime.fromtimestamp(file_mtime)
                 time_str = mtime_dt.strftime("%Y-%m-%d %H:%M:%S")
                 print(f"Using cached file: {self.local_filename} (last modified: {time_str})")
-                return pd.read_parquet(self.local_filename)
+                return self._read_parquet()
         
-        response = requests.get(self.url)
-        response.raise_for_status()
+        # ask the server to only send the file if it changed since the last download
+        headers = {}
+        if os.path.exists(self.local_filename):
+            validators = self._load_validators()
+            if validators.get('etag'):
+                headers['If-None-Match'] = validators['etag']
+            if validators.get('last_modified'):
+                headers['If-Modified-Since'] = validators['last_modified']
         
-        with open(self.local_filename, 'wb') as f:
-            f.write(response.content)
+        with self.session.get(self.url, headers=headers, stream=True) as response:
+            if response.status_code == 304:
+                # restart the cache period of the unchanged file, the decoded copy stays valid as well
+                feather_valid = self._feather_is_current()
+                os.utime(self.local_filename)
+                if feather_valid:
+                    os.utime(self.feather_filename)
+                print(f"Dataset unchanged, using cached file: {self.local_filename}")
+                return self._read_parquet()
+            
+            response.raise_for_status()
+            
+            # streamed to a .part file in 1 MiB chunks, it only replaces the cached file once it's complete
+            part_filename = f"{self.local_filename}.part"
+            with open(part_filename, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=1024 * 1024):
+                    f.write(chunk)
+            os.replace(part_filename, self.local_filename)
+            self._save_validators(response)
         print(f"Download completed: {self.local_filename}")
         
-        return pd.read_parquet(self.local_filename)
+        return self._read_parquet()
+    
+    def _read_parquet(self):
+        """
+        Read the local file, only the selected columns are read and decoded.
+        
+        The decoded columns are kept in an uncompressed Feather file next to it, which is read instead
+        as long as it's newer than the parquet file and contains all the selected columns.
+        
+        :return: DataFrame containing the selected columns
+        :rtype: pandas.DataFrame
+        """
+
+        # the column names are always resolved, so the Feather copy can be checked against them
+        names = pq.read_schema(self.local_filename).names
+        columns = self.columns
+        if columns is None:
+            columns = names
+        elif callable(columns):
+            columns = [name for name in names if columns(name)]
+        
+        if self._feather_is_current():
+            try:
+                return pd.read_feather(self.feather_filename, columns=columns, dtype_backend='pyarrow')
+            except ValueError:
+                # a column is missing in the decoded copy, it's written again below
+                pass
+        
+        dataframe = pd.read_parquet(self.local_filename, columns=columns, engine='pyarrow', dtype_backend='pyarrow')
+        self._write_feather(dataframe)
+        return dataframe
+    
+    def _write_feather(self, dataframe):
+        """
+        Write the decoded columns to the Feather copy, it's only a cache so failing to write it is not an error.
+        
+        :param dataframe: The decoded columns
+        :type dataframe: pandas.DataFrame
+        """
+
+        # written to a .part file first, so a half-written copy is never taken for a current one
+        part_filename = f"{self.feather_filename}.part"
+        try:
+            dataframe.to_feather(part_filename)
+            os.replace(part_filename, self.feather_filename)
+        except (OSError, ValueError) as e:
+            print(f"Could not write cached copy {self.feather_filename}: {e}")
+            try:
+                os.remove(part_filename)
+            except OSError:
+                pass
+    
+    def _feather_is_current(self):
+        """
+        Check if the decoded Feather copy exists and is not older than the parquet file.
+        
+        :return: True if the Feather copy can be used
+        :rtype: bool
+        """
+
+        try:
+            return os.path.getmtime(self.feather_filename) >= os.path.getmtime(self.local_filename)
+        except OSError:
+            return False
+    
+    def _load_validators(self):
+        """
+        Load the ETag and Last-Modified header of the last download.
+        
+        :return: The stored validators, empty if there are none
+        :rtype: dict
+        """
+
+        try:
+            with open(self.meta_filename) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_validators(self, response):
+        """
+        Store the ETag and Last-Modified header of a download next to the file.
+        
+        :param response: The response of the download
+        :type response: requests.Response
+        """
+
+        validators = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified')
+        }
+        with open(self.meta_filename, 'w') as f:
+            json.dump(validators, f)
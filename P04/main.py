@@ -1,13 +1,15 @@
 from P04.downloader import DatasetDownloader
-from P04.dataset_processor import AccidentDataProcessor
+from P04.dataset_processor import AccidentDataProcessor, LANGUAGE_SUFFIXES
 
 
 url = "https://data.stadt-zuerich.ch/dataset/sid_dav_strassenverkehrsunfallorte/download/RoadTrafficAccidentLocations.parquet"
 
-downloader = DatasetDownloader(url)
+# the language variants are dropped by the processor anyway, so they aren't read at all
+downloader = DatasetDownloader(url, columns=lambda name: not name.endswith(LANGUAGE_SUFFIXES))
 raw_dataset = downloader.load_as_dataframe()
 
 processor = AccidentDataProcessor(raw_dataset)
-stats = processor.calculate_statistics()
+stats = processor.compute_statistics()
+processor.print_statistics(stats)
 processor.visualize_data(viz_type='scatter')
 processor.visualize_data(viz_type='heatmap')